@@ -1,5 +1,7 @@
+import copy
 import os
 import yaml
+from functools import lru_cache
 from typing import Dict, Any
 from src.models.genre_template import (
     GenreTemplate,
@@ -10,6 +12,16 @@ from src.models.genre_template import (
     ConventionImportance,
 )
 from src.models.narrative_beat import BeatType
+from src.lib.yaml_loader import YamlLoader
+
+
+@lru_cache(maxsize=64)
+def _parse_genre_file(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a genre YAML file, reused by every loader until the file changes."""
+    with open(path, "r") as f:
+        data = yaml.load(f, Loader=YamlLoader)
+    # An empty file parses to None; treat anything but a mapping as no settings
+    return data if isinstance(data, dict) else {}
 
 
 class GenreLoader:
@@ -24,12 +36,15 @@ class GenreLoader:
         genres = {}
         for filename in os.listdir(self.config_path):
             if filename.endswith(".yaml"):
-                with open(os.path.join(self.config_path, filename), "r") as f:
-                    genre_data = yaml.safe_load(f)
-                    genre_name = filename.replace(".yaml", "")
-                    genres[genre_name] = self._create_genre_template(
-                        genre_name, genre_data
-                    )
+                path = os.path.join(self.config_path, filename)
+                # Templates keep the parsed lists, so each loader gets its own copy
+                genre_data = copy.deepcopy(
+                    _parse_genre_file(path, os.stat(path).st_mtime_ns)
+                )
+                genre_name = filename.replace(".yaml", "")
+                genres[genre_name] = self._create_genre_template(
+                    genre_name, genre_data
+                )
         return genres
 
     def _create_genre_template(
@@ -26,4 +26,5 @@ class RedisClient:
         # If value is a dataclass, convert it to dict first
         if hasattr(value, "__dataclass_fields__"):
             value = asdict(value)
-        self.client.set(key, json.dumps(value, default=str))
+        # Compact separators keep the stored payload small for large analysis caches
+        self.client.set(key, json.dumps(value, default=str, separators=(",", ":")))
@@ -0,0 +1,5 @@
+# Prefer libyaml's C parser when PyYAML was built with it.
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as YamlLoader  # type: ignore[assignment]
@@ -1,4 +1,5 @@
-from typing import List, Dict, Any
+from collections import Counter
+from typing import List, Dict, Any, Optional
 from src.services.narrative.analyzer import NarrativeAnalyzer
 from src.services.session_manager import StorySessionManager
 
@@ -17,11 +18,15 @@ class PlotThreadsHandler:
         # In a real implementation, you would analyze the plot threads
         # and update their lifecycle stages.
         
+        # Build the analysis and tally lifecycle stages in the same pass
         thread_analysis = []
+        stage_counts: Counter[Optional[str]] = Counter()
         for thread in threads:
+            stage = thread.get("current_stage")
+            stage_counts[stage] += 1
             thread_analysis.append({
                 "thread_id": thread.get("id"),
-                "lifecycle_stage": thread.get("current_stage"),
+                "lifecycle_stage": stage,
                 "confidence_score": 0.9,
                 "resolution_opportunities": [],
                 "dependencies": [],
@@ -31,8 +36,8 @@ class PlotThreadsHandler:
 
         overall_assessment = {
             "total_threads": len(threads),
-            "unresolved_threads": len([t for t in threads if t.get("current_stage") != "resolved"]),
-            "abandoned_threads": len([t for t in threads if t.get("current_stage") == "abandoned"]),
+            "unresolved_threads": len(threads) - stage_counts["resolved"],
+            "abandoned_threads": stage_counts["abandoned"],
             "narrative_cohesion_score": 0.85,
             "confidence_score": 0.9
         }
@@ -20,7 +20,7 @@ class RuleScope(Enum):
     NARRATIVE_BEAT = "narrative_beat"
     CHARACTER_JOURNEY = "character_journey"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidationLogic:
     conditions: List[str]
     assertions: List[str]
@@ -28,7 +28,7 @@ class ValidationLogic:
     confidence_penalty: float
     suggested_fix: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class ConsistencyRule:
     id: str
     name: str
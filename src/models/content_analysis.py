@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import List, Dict, Any
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ContentWarning:
     warning_type: str
     description: str
@@ -9,7 +9,7 @@ class ContentWarning:
     suggested_remediation: str
     confidence_penalty: float
 
-@dataclass
+@dataclass(slots=True)
 class ContentAnalysisResult:
     content_id: str
     completeness_score: float
@@ -8,7 +8,7 @@ class ConventionImportance(Enum):
     TYPICAL = "typical"
     OPTIONAL = "optional"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Convention:
     name: str
     description: str
@@ -17,23 +17,23 @@ class Convention:
     violations_allowed: bool
     confidence_weight: float
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GenrePacing:
     name: str
     curve: List[float]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CharacterArchetype:
     name: str
     description: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AuthenticityRule:
     name: str
     description: str
     validation_logic: str
 
-@dataclass
+@dataclass(slots=True)
 class GenreTemplate:
     id: str
     name: str
@@ -14,7 +14,7 @@ class BeatType(Enum):
     VICTORY = "victory"
     TWIST = "twist"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NarrativeBeat:
     id: str
     story_arc_id: str
@@ -18,7 +18,7 @@ class ThreadType(Enum):
     ROMANCE = "romance"
     CONFLICT = "conflict"
 
-@dataclass
+@dataclass(slots=True)
 class PlotThread:
     id: str
     story_arc_id: str
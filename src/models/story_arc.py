@@ -9,7 +9,7 @@ class ArcStatus(Enum):
     VALIDATED = "validated"
     COMPLETE = "complete"
 
-@dataclass
+@dataclass(slots=True)
 class Act:
     start_position: float
     end_position: float
@@ -17,12 +17,12 @@ class Act:
     key_events: List[str]
     character_arcs: List[str]
 
-@dataclass
+@dataclass(slots=True)
 class TurningPoint:
     position: float
     description: str
 
-@dataclass
+@dataclass(slots=True)
 class ActStructure:
     act_one: Act
     act_two: Act
@@ -30,14 +30,14 @@ class ActStructure:
     turning_points: List[TurningPoint]
     confidence_score: float
 
-@dataclass
+@dataclass(slots=True)
 class PacingProfile:
     tension_curve: List[float]
     pacing_issues: List[str]
     suggested_improvements: List[str]
     confidence_score: float
 
-@dataclass
+@dataclass(slots=True)
 class StoryArc:
     id: str
     project_id: str
@@ -1,7 +1,6 @@
 import logging
 import re
-from typing import List, Dict, Any, Set, Tuple, Optional
-from datetime import datetime, timedelta
+from typing import List, Dict, Any, Tuple
 from src.models.consistency_rule import (
     ConsistencyRule,
     RuleSeverity,
@@ -11,6 +10,23 @@ from src.models.consistency_rule import (
 )
 from src.lib.error_handler import AnalysisError
 
+# Timestamp patterns are used for every event pair, so compile them once.
+_DAY_PATTERN = re.compile(r"day_(\d+)")
+_DAY_TIME_PATTERN = re.compile(r"day_(\d+)_(.+)")
+_DIGITS_PATTERN = re.compile(r"\d+")
+
+# Lookup tables consulted per comparison/issue, built once at import.
+_TIME_OF_DAY_ORDER = {"morning": 1, "afternoon": 2, "evening": 3, "night": 4}
+_SEVERITY_WEIGHTS = {"critical": 0.3, "warning": 0.15, "suggestion": 0.05}
+
+# Events that should have consequences, mapped to the keywords that count as one.
+_CONSEQUENCE_KEYWORDS = {
+    "kill": ["death", "funeral", "grief"],
+    "marry": ["wedding", "spouse", "husband", "wife"],
+    "arrest": ["jail", "prison", "trial", "court"],
+    "fire": ["unemployed", "job search", "new job"],
+}
+
 
 class ConsistencyValidator:
     def __init__(self):
@@ -97,10 +113,13 @@ class ConsistencyValidator:
             strengths = []
             recommendations = []
 
+            events = story_elements.get("events", [])
+
+            # Lowercase event descriptions once for every description-based check
+            descriptions = [event.get("description", "").lower() for event in events]
+
             # Validate timeline consistency
-            timeline_issues, timeline_strengths = self._validate_timeline(
-                story_elements.get("events", [])
-            )
+            timeline_issues, timeline_strengths = self._validate_timeline(events)
             issues.extend(timeline_issues)
             strengths.extend(timeline_strengths)
 
@@ -114,14 +133,15 @@ class ConsistencyValidator:
             # Validate world consistency
             world_issues, world_strengths = self._validate_world_rules(
                 story_elements.get("world_details", []),
-                story_elements.get("events", []),
+                events,
+                descriptions,
             )
             issues.extend(world_issues)
             strengths.extend(world_strengths)
 
             # Validate plot consistency
             plot_issues, plot_strengths = self._validate_plot_consistency(
-                story_elements
+                story_elements, descriptions
             )
             issues.extend(plot_issues)
             strengths.extend(plot_strengths)
@@ -230,8 +250,11 @@ class ConsistencyValidator:
         if not characters:
             return issues, strengths
 
-        # Track character attributes across appearances
+        # Track character attributes and protagonists in a single pass; the
+        # protagonist suggestions are reported after the attribute conflicts.
         character_tracker = {}
+        protagonist_issues = []
+        protagonist_count = 0
 
         for char in characters:
             name = char.get("name", "Unknown")
@@ -255,15 +278,11 @@ class ConsistencyValidator:
             else:
                 character_tracker[name] = attributes
 
-        # Check for character development consistency
-        for char in characters:
-            name = char.get("name", "Unknown")
-            role = char.get("role", "")
-
             # Validate protagonist consistency
-            if role == "protagonist":
-                if not char.get("attributes", {}).get("age"):
-                    issues.append(
+            if char.get("role", "") == "protagonist":
+                protagonist_count += 1
+                if not attributes.get("age"):
+                    protagonist_issues.append(
                         {
                             "type": "character",
                             "severity": "suggestion",
@@ -274,13 +293,12 @@ class ConsistencyValidator:
                         }
                     )
 
+        issues.extend(protagonist_issues)
+
         # Identify strengths
         if len(characters) > 0:
             strengths.append(f"Story includes {len(characters)} defined characters")
 
-        protagonist_count = sum(
-            1 for char in characters if char.get("role") == "protagonist"
-        )
         if protagonist_count == 1:
             strengths.append("Clear single protagonist structure")
         elif protagonist_count > 1:
@@ -289,7 +307,10 @@ class ConsistencyValidator:
         return issues, strengths
 
     def _validate_world_rules(
-        self, world_details: List[Dict[str, Any]], events: List[Dict[str, Any]]
+        self,
+        world_details: List[Dict[str, Any]],
+        events: List[Dict[str, Any]],
+        descriptions: List[str],
     ) -> Tuple[List[Dict], List[str]]:
         """Validate world building consistency."""
         issues = []
@@ -306,33 +327,41 @@ class ConsistencyValidator:
             if aspect and rule:
                 world_rules[aspect] = rule
 
-        # Validate events against world rules
-        for i, event in enumerate(events):
-            location = event.get("location", "")
-            description = event.get("description", "").lower()
-
-            # Check location-based rules
-            if "jurisdiction" in world_rules and location:
-                jurisdiction_rule = world_rules["jurisdiction"].lower()
-                if (
-                    "outside_jurisdiction" in location.lower()
-                    and "arrest" in description
-                ):
-                    issues.append(
-                        {
-                            "type": "world",
-                            "severity": "warning",
-                            "description": f"Event violates jurisdiction rule: {jurisdiction_rule}",
-                            "location": f"Event {i + 1}: {event.get('description', 'Unknown')}",
-                            "suggested_fix": "Modify event location or add explanation for jurisdiction exception",
-                            "confidence_impact": 0.1,
-                        }
-                    )
+        # Normalize the rules once instead of once per event; only string rules
+        # can be matched against event text
+        jurisdiction_rule = world_rules.get("jurisdiction", "")
+        jurisdiction_rule = (
+            jurisdiction_rule.lower() if isinstance(jurisdiction_rule, str) else ""
+        )
+        physics_rule = world_rules.get("physics", "")
+        magic_physics = isinstance(physics_rule, str) and "magic" in physics_rule.lower()
+
+        # Validate events against world rules, skipping the scan entirely when
+        # none of the checkable rules are defined
+        if jurisdiction_rule or magic_physics:
+            for i, event in enumerate(events):
+                location = event.get("location", "")
+                description = descriptions[i]
+
+                # Check location-based rules
+                if jurisdiction_rule and location:
+                    if (
+                        "outside_jurisdiction" in location.lower()
+                        and "arrest" in description
+                    ):
+                        issues.append(
+                            {
+                                "type": "world",
+                                "severity": "warning",
+                                "description": f"Event violates jurisdiction rule: {jurisdiction_rule}",
+                                "location": f"Event {i + 1}: {event.get('description', 'Unknown')}",
+                                "suggested_fix": "Modify event location or add explanation for jurisdiction exception",
+                                "confidence_impact": 0.1,
+                            }
+                        )
 
-            # Check physics/magic rules
-            if "physics" in world_rules:
-                physics_rule = world_rules["physics"].lower()
-                if "magic" in physics_rule and "impossible" in description:
+                # Check physics/magic rules
+                if magic_physics and "impossible" in description:
                     issues.append(
                         {
                             "type": "world",
@@ -356,7 +385,7 @@ class ConsistencyValidator:
         return issues, strengths
 
     def _validate_plot_consistency(
-        self, story_elements: Dict[str, Any]
+        self, story_elements: Dict[str, Any], descriptions: List[str]
     ) -> Tuple[List[Dict], List[str]]:
         """Validate plot consistency and logical flow."""
         issues = []
@@ -368,9 +397,8 @@ class ConsistencyValidator:
         # Check for plot holes - events that reference unknown characters
         character_names = {char.get("name", "").lower() for char in characters}
 
-        for i, event in enumerate(events):
+        for i, (event, description) in enumerate(zip(events, descriptions)):
             event_chars = event.get("characters", [])
-            description = event.get("description", "").lower()
 
             # Check if event references undefined characters
             for char_name in event_chars:
@@ -400,7 +428,7 @@ class ConsistencyValidator:
                 )
 
         # Check for cause and effect consistency
-        cause_effect_issues = self._analyze_cause_effect(events)
+        cause_effect_issues = self._analyze_cause_effect(events, descriptions)
         issues.extend(cause_effect_issues)
 
         # Identify strengths
@@ -412,47 +440,56 @@ class ConsistencyValidator:
 
         return issues, strengths
 
-    def _analyze_cause_effect(self, events: List[Dict[str, Any]]) -> List[Dict]:
+    def _analyze_cause_effect(
+        self,
+        events: List[Dict[str, Any]],
+        descriptions: List[str],
+    ) -> List[Dict]:
         """Analyze cause and effect relationships between events."""
-        issues = []
-
-        # Look for events that should have consequences
-        consequence_keywords = {
-            "kill": ["death", "funeral", "grief"],
-            "marry": ["wedding", "spouse", "husband", "wife"],
-            "arrest": ["jail", "prison", "trial", "court"],
-            "fire": ["unemployed", "job search", "new job"],
-        }
+        issues: List[Dict] = []
 
-        for i, event in enumerate(events):
-            description = event.get("description", "").lower()
-
-            for trigger, expected_consequences in consequence_keywords.items():
-                if trigger in description:
-                    # Look for consequences in subsequent events
-                    found_consequence = False
-                    for j in range(
-                        i + 1, min(i + 5, len(events))
-                    ):  # Check next 4 events
-                        next_event = events[j].get("description", "").lower()
-                        if any(
-                            consequence in next_event
-                            for consequence in expected_consequences
-                        ):
-                            found_consequence = True
-                            break
-
-                    if not found_consequence:
-                        issues.append(
-                            {
-                                "type": "plot",
-                                "severity": "suggestion",
-                                "description": f"Event '{trigger}' may lack appropriate consequences",
-                                "location": f"Event {i + 1}",
-                                "suggested_fix": f"Consider adding consequences related to {trigger}",
-                                "confidence_impact": 0.05,
-                            }
+        # Find the triggers in each event first; stories without any skip the
+        # consequence scan entirely.
+        present_triggers = [
+            [trigger for trigger in _CONSEQUENCE_KEYWORDS if trigger in description]
+            for description in descriptions
+        ]
+        if not any(present_triggers):
+            return issues
+
+        # Whether each event resolves a trigger, recorded the first time a
+        # preceding trigger looks at that event so no check is repeated.
+        resolved_triggers: List[Dict[str, bool]] = [{} for _ in descriptions]
+
+        for i, triggers in enumerate(present_triggers):
+            if not triggers:
+                continue
+
+            for trigger in triggers:
+                # Look for consequences in the next 4 events
+                found_consequence = False
+                for j in range(i + 1, min(i + 5, len(descriptions))):
+                    resolved = resolved_triggers[j].get(trigger)
+                    if resolved is None:
+                        resolved = resolved_triggers[j][trigger] = any(
+                            consequence in descriptions[j]
+                            for consequence in _CONSEQUENCE_KEYWORDS[trigger]
                         )
+                    if resolved:
+                        found_consequence = True
+                        break
+
+                if not found_consequence:
+                    issues.append(
+                        {
+                            "type": "plot",
+                            "severity": "suggestion",
+                            "description": f"Event '{trigger}' may lack appropriate consequences",
+                            "location": f"Event {i + 1}",
+                            "suggested_fix": f"Consider adding consequences related to {trigger}",
+                            "confidence_impact": 0.05,
+                        }
+                    )
 
         return issues
 
@@ -463,45 +500,28 @@ class ConsistencyValidator:
             if isinstance(timestamp1, str) and isinstance(timestamp2, str):
                 # Try to parse as day_time format
                 if "_" in timestamp1 and "_" in timestamp2:
-                    # Extract day number and time separately
-                    day1_match = re.search(r"day_(\d+)", timestamp1)
-                    day2_match = re.search(r"day_(\d+)", timestamp2)
-
-                    time1_match = re.search(r"day_\d+_(.+)", timestamp1)
-                    time2_match = re.search(r"day_\d+_(.+)", timestamp2)
-
-                    if day1_match and day2_match and time1_match and time2_match:
-                        day1_num = int(day1_match.group(1))
-                        day2_num = int(day2_match.group(1))
-                        time1 = time1_match.group(1)
-                        time2 = time2_match.group(1)
+                    # Extract day number and time with a single match each
+                    match1 = _DAY_TIME_PATTERN.search(timestamp1)
+                    match2 = _DAY_TIME_PATTERN.search(timestamp2)
+
+                    if match1 and match2:
+                        day1_num, time1 = int(match1.group(1)), match1.group(2)
+                        day2_num, time2 = int(match2.group(1)), match2.group(2)
                     else:
                         # Fallback to original logic if pattern doesn't match
                         day1, time1 = timestamp1.split("_", 1)
                         day2, time2 = timestamp2.split("_", 1)
-                        day1_num = (
-                            int(re.search(r"\d+", day1).group())
-                            if re.search(r"\d+", day1)
-                            else 0
-                        )
-                        day2_num = (
-                            int(re.search(r"\d+", day2).group())
-                            if re.search(r"\d+", day2)
-                            else 0
-                        )
+                        digits1 = _DIGITS_PATTERN.search(day1)
+                        digits2 = _DIGITS_PATTERN.search(day2)
+                        day1_num = int(digits1.group()) if digits1 else 0
+                        day2_num = int(digits2.group()) if digits2 else 0
 
                     if day1_num != day2_num:
                         return -1 if day1_num < day2_num else 1
 
                     # Compare times within the same day
-                    time_order = {
-                        "morning": 1,
-                        "afternoon": 2,
-                        "evening": 3,
-                        "night": 4,
-                    }
-                    time1_val = time_order.get(time1.lower(), 2)
-                    time2_val = time_order.get(time2.lower(), 2)
+                    time1_val = _TIME_OF_DAY_ORDER.get(time1.lower(), 2)
+                    time2_val = _TIME_OF_DAY_ORDER.get(time2.lower(), 2)
 
                     return (
                         -1
@@ -533,32 +553,29 @@ class ConsistencyValidator:
         """Detect potential gaps in the timeline."""
         gaps = []
 
-        for i in range(len(events) - 1):
-            event1 = events[i]
-            event2 = events[i + 1]
+        # Each timestamp is parsed once and its day number carried forward to
+        # the next comparison.
+        previous_day = None
+        for i, event in enumerate(events):
+            day = None
+            timestamp = event.get("timestamp")
+
+            # Simple gap detection for day-based timestamps
+            if isinstance(timestamp, str) and "_" in timestamp:
+                day_match = _DAY_PATTERN.search(timestamp.lower())
+                if day_match:
+                    day = int(day_match.group(1))
+
+            # Check for large time jumps (more than 3 days)
+            if previous_day is not None and day is not None and day - previous_day > 3:
+                gaps.append(
+                    {
+                        "description": f"Large time gap between day {previous_day} and day {day}",
+                        "location": f"Between events {i} and {i + 1}",
+                    }
+                )
 
-            # Check for large time jumps
-            if "timestamp" in event1 and "timestamp" in event2:
-                timestamp1 = event1["timestamp"]
-                timestamp2 = event2["timestamp"]
-
-                # Simple gap detection for day-based timestamps
-                if isinstance(timestamp1, str) and isinstance(timestamp2, str):
-                    if "_" in timestamp1 and "_" in timestamp2:
-                        day1_match = re.search(r"day_(\d+)", timestamp1.lower())
-                        day2_match = re.search(r"day_(\d+)", timestamp2.lower())
-
-                        if day1_match and day2_match:
-                            day1 = int(day1_match.group(1))
-                            day2 = int(day2_match.group(1))
-
-                            if day2 - day1 > 3:  # Gap of more than 3 days
-                                gaps.append(
-                                    {
-                                        "description": f"Large time gap between day {day1} and day {day2}",
-                                        "location": f"Between events {i + 1} and {i + 2}",
-                                    }
-                                )
+            previous_day = day
 
         return gaps
 
@@ -610,13 +627,13 @@ class ConsistencyValidator:
             )
 
         # Critical issue recommendations
-        critical_issues = [
-            issue for issue in issues if issue.get("severity") == "critical"
-        ]
-        if critical_issues:
+        critical_count = sum(
+            1 for issue in issues if issue.get("severity") == "critical"
+        )
+        if critical_count:
             recommendations.insert(
                 0,
-                f"Address {len(critical_issues)} critical consistency issues immediately",
+                f"Address {critical_count} critical consistency issues immediately",
             )
 
         return recommendations
@@ -626,14 +643,13 @@ class ConsistencyValidator:
         if not issues:
             return 1.0
 
-        # Weight issues by severity
-        severity_weights = {"critical": 0.3, "warning": 0.15, "suggestion": 0.05}
-
+        # Weight issues by severity, stopping once the score is already floored
         total_penalty = 0.0
         for issue in issues:
             severity = issue.get("severity", "suggestion")
-            penalty = severity_weights.get(severity, 0.05)
-            total_penalty += penalty
+            total_penalty += _SEVERITY_WEIGHTS.get(severity, 0.05)
+            if total_penalty >= 1.0:
+                break
 
         # Calculate score with diminishing returns for many issues
         raw_score = 1.0 - total_penalty
@@ -661,10 +677,10 @@ class ConsistencyValidator:
             base_confidence -= 0.1
 
         # Penalty for unresolved critical issues
-        critical_issues = [
-            issue for issue in issues if issue.get("severity") == "critical"
-        ]
-        base_confidence -= len(critical_issues) * 0.05
+        critical_count = sum(
+            1 for issue in issues if issue.get("severity") == "critical"
+        )
+        base_confidence -= critical_count * 0.05
 
         # Bonus for comprehensive data
         if len(events) >= 5 and len(characters) >= 3:
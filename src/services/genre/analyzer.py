@@ -1,55 +1,115 @@
 import logging
 import re
-from typing import List, Dict, Any, Set, Tuple, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Set, Tuple, Optional
 from src.lib.genre_loader import GenreLoader
 from src.models.genre_template import ConventionImportance
 from src.lib.error_handler import AnalysisError
 
+# Genre pattern recognition rules, shared read-only by every analyzer instance.
+_GENRE_PATTERNS = MappingProxyType({
+    "thriller": MappingProxyType({
+        "keywords": ("danger", "threat", "chase", "escape", "suspense", "tension", "deadline", "race", "urgent"),
+        "character_patterns": ("detective", "agent", "spy", "investigator", "villain", "mastermind"),
+        "plot_patterns": ("conspiracy", "betrayal", "twist", "revelation", "pursuit", "countdown"),
+        "pacing_indicators": ("fast", "quick", "sudden", "immediate", "urgent", "rapid"),
+        "atmosphere": ("dark", "mysterious", "ominous", "foreboding", "sinister")
+    }),
+    "romance": MappingProxyType({
+        "keywords": ("love", "heart", "passion", "romance", "relationship", "attraction", "kiss", "wedding"),
+        "character_patterns": ("lover", "partner", "beloved", "soulmate", "romantic interest"),
+        "plot_patterns": ("meet-cute", "misunderstanding", "separation", "reunion", "proposal"),
+        "pacing_indicators": ("gentle", "tender", "slow", "intimate", "emotional"),
+        "atmosphere": ("warm", "tender", "passionate", "romantic", "intimate")
+    }),
+    "horror": MappingProxyType({
+        "keywords": ("fear", "terror", "scream", "blood", "death", "monster", "nightmare", "haunted"),
+        "character_patterns": ("victim", "monster", "ghost", "demon", "survivor", "final girl"),
+        "plot_patterns": ("haunting", "possession", "curse", "ritual", "sacrifice", "survival"),
+        "pacing_indicators": ("slow", "building", "sudden", "shocking", "terrifying"),
+        "atmosphere": ("dark", "eerie", "creepy", "terrifying", "supernatural")
+    }),
+    "comedy": MappingProxyType({
+        "keywords": ("funny", "laugh", "joke", "humor", "amusing", "hilarious", "comic", "witty"),
+        "character_patterns": ("comedian", "fool", "trickster", "straight man", "comic relief"),
+        "plot_patterns": ("misunderstanding", "mistaken identity", "pratfall", "wordplay", "irony"),
+        "pacing_indicators": ("light", "quick", "snappy", "bouncy", "energetic"),
+        "atmosphere": ("light", "cheerful", "playful", "absurd", "satirical")
+    }),
+    "drama": MappingProxyType({
+        "keywords": ("emotion", "conflict", "struggle", "family", "relationship", "growth", "change"),
+        "character_patterns": ("protagonist", "family member", "friend", "mentor", "rival"),
+        "plot_patterns": ("coming of age", "family drama", "personal growth", "moral dilemma"),
+        "pacing_indicators": ("steady", "measured", "thoughtful", "deliberate"),
+        "atmosphere": ("realistic", "emotional", "serious", "contemplative")
+    })
+})
+
+# Compliance weight per convention importance
+_CONVENTION_WEIGHTS = {
+    ConventionImportance.ESSENTIAL: 1.0,
+    ConventionImportance.TYPICAL: 0.7,
+    ConventionImportance.OPTIONAL: 0.3,
+}
+
+# Convention indicator terms, matched as substrings of beat and character text.
+_HIGH_STAKES_INDICATORS = ("death", "life", "world", "destroy", "save", "critical", "urgent", "disaster")
+_TIME_INDICATORS = ("deadline", "time", "hurry", "quick", "fast", "urgent", "countdown", "before")
+_ROMANTIC_CHARACTER_TERMS = ("love", "romantic", "partner", "lover")
+_ROMANTIC_BEAT_TERMS = ("meet", "attraction", "kiss", "date", "proposal", "wedding", "relationship")
+_HORROR_INDICATORS = ("fear", "terror", "monster", "ghost", "haunted", "supernatural", "death", "blood")
+_COMEDY_INDICATORS = ("funny", "laugh", "joke", "humor", "comic", "amusing", "silly", "ridiculous")
+
+# Key terms are words of four or more letters in a convention description.
+_KEY_TERM_PATTERN = re.compile(r'\b\w{4,}\b')
+
+@lru_cache(maxsize=256)
+def _convention_key_terms(description: str) -> Tuple[str, ...]:
+    """Extract key terms from a convention description, once per description."""
+    return tuple(_KEY_TERM_PATTERN.findall(description.lower()))
+
+@lru_cache(maxsize=256)
+def _convention_kind(name: str) -> str:
+    """Classify a convention by name, once per distinct convention name."""
+    convention_name = name.lower()
+
+    # High Stakes (Thriller)
+    if "high stakes" in convention_name:
+        return "high_stakes"
+
+    # Fast-Paced Plot (Thriller)
+    elif "fast" in convention_name and "pace" in convention_name:
+        return "fast_pace"
+
+    # Race Against Time (Thriller)
+    elif "race" in convention_name and "time" in convention_name:
+        return "time_pressure"
+
+    # Romance conventions
+    elif "romantic" in convention_name or "love" in convention_name:
+        return "romantic"
+
+    # Horror conventions
+    elif "supernatural" in convention_name or "fear" in convention_name:
+        return "horror"
+
+    # Comedy conventions
+    elif "humor" in convention_name or "comic" in convention_name:
+        return "comedic"
+
+    # Default pattern matching
+    return "general"
+
 class GenreAnalyzer:
     def __init__(self, genre_loader: GenreLoader):
         self.genre_loader = genre_loader
         self.logger = logging.getLogger(__name__)
         self.genre_patterns = self._initialize_genre_patterns()
 
-    def _initialize_genre_patterns(self) -> Dict[str, Dict]:
+    def _initialize_genre_patterns(self) -> Mapping[str, Mapping[str, Tuple[str, ...]]]:
         """Initialize genre-specific pattern recognition rules."""
-        return {
-            "thriller": {
-                "keywords": ["danger", "threat", "chase", "escape", "suspense", "tension", "deadline", "race", "urgent"],
-                "character_patterns": ["detective", "agent", "spy", "investigator", "villain", "mastermind"],
-                "plot_patterns": ["conspiracy", "betrayal", "twist", "revelation", "pursuit", "countdown"],
-                "pacing_indicators": ["fast", "quick", "sudden", "immediate", "urgent", "rapid"],
-                "atmosphere": ["dark", "mysterious", "ominous", "foreboding", "sinister"]
-            },
-            "romance": {
-                "keywords": ["love", "heart", "passion", "romance", "relationship", "attraction", "kiss", "wedding"],
-                "character_patterns": ["lover", "partner", "beloved", "soulmate", "romantic interest"],
-                "plot_patterns": ["meet-cute", "misunderstanding", "separation", "reunion", "proposal"],
-                "pacing_indicators": ["gentle", "tender", "slow", "intimate", "emotional"],
-                "atmosphere": ["warm", "tender", "passionate", "romantic", "intimate"]
-            },
-            "horror": {
-                "keywords": ["fear", "terror", "scream", "blood", "death", "monster", "nightmare", "haunted"],
-                "character_patterns": ["victim", "monster", "ghost", "demon", "survivor", "final girl"],
-                "plot_patterns": ["haunting", "possession", "curse", "ritual", "sacrifice", "survival"],
-                "pacing_indicators": ["slow", "building", "sudden", "shocking", "terrifying"],
-                "atmosphere": ["dark", "eerie", "creepy", "terrifying", "supernatural"]
-            },
-            "comedy": {
-                "keywords": ["funny", "laugh", "joke", "humor", "amusing", "hilarious", "comic", "witty"],
-                "character_patterns": ["comedian", "fool", "trickster", "straight man", "comic relief"],
-                "plot_patterns": ["misunderstanding", "mistaken identity", "pratfall", "wordplay", "irony"],
-                "pacing_indicators": ["light", "quick", "snappy", "bouncy", "energetic"],
-                "atmosphere": ["light", "cheerful", "playful", "absurd", "satirical"]
-            },
-            "drama": {
-                "keywords": ["emotion", "conflict", "struggle", "family", "relationship", "growth", "change"],
-                "character_patterns": ["protagonist", "family member", "friend", "mentor", "rival"],
-                "plot_patterns": ["coming of age", "family drama", "personal growth", "moral dilemma"],
-                "pacing_indicators": ["steady", "measured", "thoughtful", "deliberate"],
-                "atmosphere": ["realistic", "emotional", "serious", "contemplative"]
-            }
-        }
+        return _GENRE_PATTERNS
 
     def analyze_genre(self, story_beats: List[Dict[str, Any]], character_types: List[Dict[str, Any]], target_genre: str) -> Dict[str, Any]:
         """
@@ -170,54 +230,37 @@ class GenreAnalyzer:
 
     def _evaluate_convention(self, convention, story_beats: List[Dict], character_types: List[Dict], content_analysis: Dict) -> bool:
         """Evaluate whether a specific convention is met."""
-        convention_name = convention.name.lower()
+        convention_kind = _convention_kind(convention.name)
 
-        # High Stakes (Thriller)
-        if "high stakes" in convention_name:
+        if convention_kind == "high_stakes":
             return self._check_high_stakes(story_beats, content_analysis)
-
-        # Fast-Paced Plot (Thriller)
-        elif "fast" in convention_name and "pace" in convention_name:
+        elif convention_kind == "fast_pace":
             return content_analysis.get("pacing_matches", 0) >= 2
-
-        # Race Against Time (Thriller)
-        elif "race" in convention_name and "time" in convention_name:
+        elif convention_kind == "time_pressure":
             return self._check_time_pressure(story_beats)
-
-        # Romance conventions
-        elif "romantic" in convention_name or "love" in convention_name:
+        elif convention_kind == "romantic":
             return self._check_romantic_elements(story_beats, character_types, content_analysis)
-
-        # Horror conventions
-        elif "supernatural" in convention_name or "fear" in convention_name:
+        elif convention_kind == "horror":
             return self._check_horror_elements(story_beats, content_analysis)
-
-        # Comedy conventions
-        elif "humor" in convention_name or "comic" in convention_name:
+        elif convention_kind == "comedic":
             return self._check_comedic_elements(story_beats, content_analysis)
-
-        # Default pattern matching
         else:
             return self._check_general_convention(convention, story_beats, content_analysis)
 
     def _check_high_stakes(self, story_beats: List[Dict], content_analysis: Dict) -> bool:
         """Check for high stakes elements."""
-        high_stakes_indicators = ["death", "life", "world", "destroy", "save", "critical", "urgent", "disaster"]
-
         for beat in story_beats:
             description = beat.get("description", "").lower()
-            if any(indicator in description for indicator in high_stakes_indicators):
+            if any(indicator in description for indicator in _HIGH_STAKES_INDICATORS):
                 return True
 
         return content_analysis.get("keyword_matches", 0) >= 3
 
     def _check_time_pressure(self, story_beats: List[Dict]) -> bool:
         """Check for time pressure elements."""
-        time_indicators = ["deadline", "time", "hurry", "quick", "fast", "urgent", "countdown", "before"]
-
         for beat in story_beats:
             description = beat.get("description", "").lower()
-            if any(indicator in description for indicator in time_indicators):
+            if any(indicator in description for indicator in _TIME_INDICATORS):
                 return True
 
         return False
@@ -228,49 +271,41 @@ class GenreAnalyzer:
         for char in character_types:
             role = char.get("role", "").lower()
             archetype = char.get("archetype", "").lower()
-            if any(term in f"{role} {archetype}" for term in ["love", "romantic", "partner", "lover"]):
+            if any(term in f"{role} {archetype}" for term in _ROMANTIC_CHARACTER_TERMS):
                 return True
 
         # Check for romantic beats
-        romantic_beats = ["meet", "attraction", "kiss", "date", "proposal", "wedding", "relationship"]
         for beat in story_beats:
             description = beat.get("description", "").lower()
             beat_type = beat.get("type", "").lower()
-            if any(term in f"{description} {beat_type}" for term in romantic_beats):
+            if any(term in f"{description} {beat_type}" for term in _ROMANTIC_BEAT_TERMS):
                 return True
 
         return content_analysis.get("keyword_matches", 0) >= 2
 
     def _check_horror_elements(self, story_beats: List[Dict], content_analysis: Dict) -> bool:
         """Check for horror elements."""
-        horror_indicators = ["fear", "terror", "monster", "ghost", "haunted", "supernatural", "death", "blood"]
-
         for beat in story_beats:
             description = beat.get("description", "").lower()
-            if any(indicator in description for indicator in horror_indicators):
+            if any(indicator in description for indicator in _HORROR_INDICATORS):
                 return True
 
         return content_analysis.get("atmosphere_score", 0) >= 0.3
 
     def _check_comedic_elements(self, story_beats: List[Dict], content_analysis: Dict) -> bool:
         """Check for comedic elements."""
-        comedy_indicators = ["funny", "laugh", "joke", "humor", "comic", "amusing", "silly", "ridiculous"]
-
         for beat in story_beats:
             description = beat.get("description", "").lower()
             beat_type = beat.get("type", "").lower()
-            if any(indicator in f"{description} {beat_type}" for indicator in comedy_indicators):
+            if any(indicator in f"{description} {beat_type}" for indicator in _COMEDY_INDICATORS):
                 return True
 
         return content_analysis.get("keyword_matches", 0) >= 2
 
     def _check_general_convention(self, convention, story_beats: List[Dict], content_analysis: Dict) -> bool:
         """General convention checking using keyword matching."""
-        convention_desc = convention.description.lower()
-        convention_name = convention.name.lower()
-
         # Extract key terms from convention description
-        key_terms = re.findall(r'\b\w{4,}\b', convention_desc)
+        key_terms = _convention_key_terms(convention.description)
 
         # Check story beats for these terms
         matches = 0
@@ -288,14 +323,7 @@ class GenreAnalyzer:
 
     def _get_convention_weight(self, importance) -> float:
         """Get weight for convention based on importance."""
-        if importance == ConventionImportance.ESSENTIAL:
-            return 1.0
-        elif importance == ConventionImportance.TYPICAL:
-            return 0.7
-        elif importance == ConventionImportance.OPTIONAL:
-            return 0.3
-        else:
-            return 0.5
+        return _CONVENTION_WEIGHTS.get(importance, 0.5)
 
     def _calculate_genre_confidence(self, content_analysis: Dict, num_beats: int, num_characters: int) -> float:
         """Calculate confidence in genre analysis."""
@@ -362,8 +390,8 @@ class GenreAnalyzer:
         """Identify genre-specific story beats."""
         genre_beats = []
 
-        # Get common beats for this genre from template
-        common_beats = getattr(genre_template, 'common_beats', [])
+        # Get common beats for this genre from template, indexed once for the beat scan
+        common_beats = set(getattr(genre_template, 'common_beats', []))
 
         # Map story beats to genre-specific beats
         for beat in story_beats:
@@ -1,7 +1,7 @@
 import re
 import logging
 import yaml
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Tuple
 from pathlib import Path
 from src.models.story_arc import (
     StoryArc,
@@ -13,6 +13,78 @@ from src.models.story_arc import (
 )
 from src.lib.genre_loader import GenreLoader
 from src.lib.error_handler import AnalysisError
+from src.lib.yaml_loader import YamlLoader
+
+# Beat detection and segmentation patterns, compiled once at import.
+_BEAT_PATTERNS = {
+    "inciting_incident": (
+        re.compile(
+            r"\b(suddenly|then|when|after)\b.*\b(discover|find|realize|learn|see)\b"
+        ),
+        re.compile(r"\b(call|message|news|letter|phone)\b"),
+        re.compile(r"\b(attack|threat|danger|crisis|problem)\b"),
+    ),
+    "midpoint": (
+        re.compile(r"\b(reveal|discover|realize|truth|secret)\b"),
+        re.compile(r"\b(betrayal|twist|surprise|shock)\b"),
+        re.compile(r"\b(halfway|middle|center)\b"),
+    ),
+    "climax": (
+        re.compile(
+            r"\b(final|last|ultimate|decisive)\b.*\b(battle|fight|confrontation|showdown)\b"
+        ),
+        re.compile(r"\b(climax|peak|culmination)\b"),
+        re.compile(
+            r"\b(face|confront|defeat|overcome)\b.*\b(enemy|villain|antagonist)\b"
+        ),
+    ),
+}
+_ACT_EVENT_PATTERN = re.compile(
+    r"\b(discover|find|realize|decide|fight|escape|meet|arrive|leave)\b"
+)
+_PARAGRAPH_BREAK_PATTERN = re.compile(r"\n\s*\n")
+_SENTENCE_BREAK_PATTERN = re.compile(r"[.!?]+")
+_SENTENCE_END_PATTERN = re.compile(r"[.!?]")
+
+# Keyword and beat lookup tables consulted per segment and beat, built once at import.
+_HIGH_TENSION_WORDS = (
+    "fight",
+    "battle",
+    "danger",
+    "threat",
+    "crisis",
+    "attack",
+    "death",
+    "kill",
+)
+_MEDIUM_TENSION_WORDS = (
+    "conflict",
+    "argue",
+    "problem",
+    "worry",
+    "fear",
+    "concern",
+    "chase",
+)
+_LOW_TENSION_WORDS = ("calm", "peaceful", "rest", "sleep", "quiet", "gentle")
+_EXPECTED_BEAT_POSITIONS = {
+    "inciting_incident": 0.12,
+    "plot_point_1": 0.25,
+    "midpoint": 0.50,
+    "plot_point_2": 0.75,
+    "climax": 0.90,
+}
+_TURNING_POINT_BEATS = {
+    "plot_point_1": "First turning point - commitment to the journey",
+    "midpoint": "Midpoint reversal - major revelation or setback",
+    "plot_point_2": "Second turning point - point of no return",
+    "climax": "Climax - final confrontation",
+}
+_BEAT_QUALITY_INDICATORS = {
+    "inciting_incident": ("character", "protagonist", "hero", "main"),
+    "midpoint": ("reveal", "discovery", "truth", "change"),
+    "climax": ("final", "ultimate", "decisive", "resolution"),
+}
 
 
 class NarrativeAnalyzer:
@@ -27,7 +99,7 @@ class NarrativeAnalyzer:
             patterns_path = Path("config/patterns/three_act_structure.yaml")
             if patterns_path.exists():
                 with open(patterns_path, "r") as f:
-                    return yaml.safe_load(f)
+                    return yaml.load(f, Loader=YamlLoader)
             else:
                 self.logger.warning("Structure patterns file not found, using defaults")
                 return self._get_default_patterns()
@@ -114,12 +186,14 @@ class NarrativeAnalyzer:
         """Segment story into logical parts based on paragraphs and scene breaks."""
         # Split by double newlines (paragraph breaks) and filter empty segments
         segments = [
-            seg.strip() for seg in re.split(r"\n\s*\n", story_content) if seg.strip()
+            seg.strip()
+            for seg in _PARAGRAPH_BREAK_PATTERN.split(story_content)
+            if seg.strip()
         ]
 
         if len(segments) < 3:
             # If too few segments, split by sentences for better analysis
-            sentences = re.split(r"[.!?]+", story_content)
+            sentences = _SENTENCE_BREAK_PATTERN.split(story_content)
             segments = [s.strip() for s in sentences if s.strip()]
 
         return segments
@@ -131,39 +205,18 @@ class NarrativeAnalyzer:
         beats = {}
         content_lower = story_content.lower()
 
-        # Define beat detection patterns
-        beat_patterns = {
-            "inciting_incident": [
-                r"\b(suddenly|then|when|after)\b.*\b(discover|find|realize|learn|see)\b",
-                r"\b(call|message|news|letter|phone)\b",
-                r"\b(attack|threat|danger|crisis|problem)\b",
-            ],
-            "midpoint": [
-                r"\b(reveal|discover|realize|truth|secret)\b",
-                r"\b(betrayal|twist|surprise|shock)\b",
-                r"\b(halfway|middle|center)\b",
-            ],
-            "climax": [
-                r"\b(final|last|ultimate|decisive)\b.*\b(battle|fight|confrontation|showdown)\b",
-                r"\b(climax|peak|culmination)\b",
-                r"\b(face|confront|defeat|overcome)\b.*\b(enemy|villain|antagonist)\b",
-            ],
-        }
-
         # Analyze each segment for beat patterns
         for i, segment in enumerate(segments):
             segment_lower = segment.lower()
             position = i / len(segments) if len(segments) > 1 else 0.5
 
-            for beat_name, patterns in beat_patterns.items():
+            for beat_name, patterns in _BEAT_PATTERNS.items():
+                expected_position = self._get_expected_position(beat_name)
                 for pattern in patterns:
-                    if re.search(pattern, segment_lower):
+                    if pattern.search(segment_lower):
                         if beat_name not in beats or abs(
-                            position - self._get_expected_position(beat_name)
-                        ) < abs(
-                            beats[beat_name]["position"]
-                            - self._get_expected_position(beat_name)
-                        ):
+                            position - expected_position
+                        ) < abs(beats[beat_name]["position"] - expected_position):
                             beats[beat_name] = {
                                 "position": position,
                                 "segment_index": i,
@@ -179,14 +232,7 @@ class NarrativeAnalyzer:
 
     def _get_expected_position(self, beat_name: str) -> float:
         """Get expected position for a story beat."""
-        expected_positions = {
-            "inciting_incident": 0.12,
-            "plot_point_1": 0.25,
-            "midpoint": 0.50,
-            "plot_point_2": 0.75,
-            "climax": 0.90,
-        }
-        return expected_positions.get(beat_name, 0.5)
+        return _EXPECTED_BEAT_POSITIONS.get(beat_name, 0.5)
 
     def _calculate_beat_confidence(
         self, beat_name: str, position: float, content: str
@@ -199,17 +245,10 @@ class NarrativeAnalyzer:
 
         # Content quality indicators
         content_lower = content.lower()
-        quality_indicators = {
-            "inciting_incident": ["character", "protagonist", "hero", "main"],
-            "midpoint": ["reveal", "discovery", "truth", "change"],
-            "climax": ["final", "ultimate", "decisive", "resolution"],
-        }
-
         quality_score = 0.5  # Base score
-        if beat_name in quality_indicators:
-            for indicator in quality_indicators[beat_name]:
-                if indicator in content_lower:
-                    quality_score += 0.1
+        for indicator in _BEAT_QUALITY_INDICATORS.get(beat_name, ()):
+            if indicator in content_lower:
+                quality_score += 0.1
 
         confidence = max(0.1, min(0.95, quality_score - position_penalty))
         return confidence
@@ -295,10 +334,7 @@ class NarrativeAnalyzer:
             for i in range(start_idx, min(end_idx, len(segments))):
                 segment = segments[i]
                 # Look for action words or significant events
-                if re.search(
-                    r"\b(discover|find|realize|decide|fight|escape|meet|arrive|leave)\b",
-                    segment.lower(),
-                ):
+                if _ACT_EVENT_PATTERN.search(segment.lower()):
                     events.append(
                         segment[:100] + "..." if len(segment) > 100 else segment
                     )
@@ -312,14 +348,7 @@ class NarrativeAnalyzer:
         turning_points = []
 
         # Map beats to turning points
-        turning_point_beats = {
-            "plot_point_1": "First turning point - commitment to the journey",
-            "midpoint": "Midpoint reversal - major revelation or setback",
-            "plot_point_2": "Second turning point - point of no return",
-            "climax": "Climax - final confrontation",
-        }
-
-        for beat_name, description in turning_point_beats.items():
+        for beat_name, description in _TURNING_POINT_BEATS.items():
             if beat_name in beats:
                 turning_points.append(
                     TurningPoint(
@@ -378,36 +407,13 @@ class NarrativeAnalyzer:
 
         # Increase tension based on content
         content_lower = segment.lower()
-        tension_words = {
-            "high": [
-                "fight",
-                "battle",
-                "danger",
-                "threat",
-                "crisis",
-                "attack",
-                "death",
-                "kill",
-            ],
-            "medium": [
-                "conflict",
-                "argue",
-                "problem",
-                "worry",
-                "fear",
-                "concern",
-                "chase",
-            ],
-            "low": ["calm", "peaceful", "rest", "sleep", "quiet", "gentle"],
-        }
-
-        for word in tension_words["high"]:
+        for word in _HIGH_TENSION_WORDS:
             if word in content_lower:
                 base_tension += 0.2
-        for word in tension_words["medium"]:
+        for word in _MEDIUM_TENSION_WORDS:
             if word in content_lower:
                 base_tension += 0.1
-        for word in tension_words["low"]:
+        for word in _LOW_TENSION_WORDS:
             if word in content_lower:
                 base_tension -= 0.1
 
@@ -454,13 +460,17 @@ class NarrativeAnalyzer:
         if not tension_curve:
             return issues, improvements
 
+        # Find the peak once; it serves both checks below
+        peak = max(tension_curve)
+        peak_index = tension_curve.index(peak)
+
         # Check for flat pacing
-        if max(tension_curve) - min(tension_curve) < 0.3:
+        if peak - min(tension_curve) < 0.3:
             issues.append("Flat pacing - insufficient tension variation")
             improvements.append("Add more dramatic peaks and valleys")
 
         # Check for proper climax
-        max_tension_pos = tension_curve.index(max(tension_curve)) / len(tension_curve)
+        max_tension_pos = peak_index / len(tension_curve)
         if max_tension_pos < 0.6:
             issues.append("Early climax - peak tension occurs too early")
             improvements.append("Build tension more gradually toward the end")
@@ -561,7 +571,7 @@ class NarrativeAnalyzer:
             return lines[0].strip()
 
         # Generate title from first sentence
-        first_sentence = re.split(r"[.!?]", story_content)[0].strip()
+        first_sentence = _SENTENCE_END_PATTERN.split(story_content, maxsplit=1)[0].strip()
         if len(first_sentence) < 100:
             return f"Story: {first_sentence[:50]}..."
 
@@ -1,131 +1,138 @@
 import logging
-import re
-from typing import List, Dict, Any, Tuple, Optional
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Tuple
 from statistics import mean, stdev
 from src.lib.error_handler import AnalysisError
 
 
+# Indicator word tables, shared read-only by every calculator instance.
+_TENSION_INDICATORS = MappingProxyType({
+    "high": MappingProxyType({
+        "action": (
+            "fight",
+            "battle",
+            "chase",
+            "escape",
+            "attack",
+            "explosion",
+            "crash",
+            "run",
+        ),
+        "emotion": (
+            "scream",
+            "panic",
+            "terror",
+            "rage",
+            "fury",
+            "desperate",
+            "frantic",
+        ),
+        "stakes": (
+            "death",
+            "kill",
+            "destroy",
+            "save",
+            "rescue",
+            "urgent",
+            "critical",
+            "final",
+        ),
+    }),
+    "medium": MappingProxyType({
+        "action": (
+            "argue",
+            "confront",
+            "search",
+            "investigate",
+            "pursue",
+            "challenge",
+        ),
+        "emotion": (
+            "worry",
+            "fear",
+            "anger",
+            "concern",
+            "tension",
+            "stress",
+            "conflict",
+        ),
+        "stakes": (
+            "important",
+            "serious",
+            "problem",
+            "trouble",
+            "danger",
+            "risk",
+        ),
+    }),
+    "low": MappingProxyType({
+        "action": (
+            "talk",
+            "discuss",
+            "walk",
+            "sit",
+            "think",
+            "remember",
+            "reflect",
+        ),
+        "emotion": (
+            "calm",
+            "peaceful",
+            "quiet",
+            "gentle",
+            "soft",
+            "relaxed",
+            "content",
+        ),
+        "stakes": (
+            "normal",
+            "routine",
+            "everyday",
+            "simple",
+            "easy",
+            "comfortable",
+        ),
+    }),
+})
+_PACING_INDICATORS = MappingProxyType({
+    "fast": (
+        "quickly",
+        "rapidly",
+        "suddenly",
+        "immediately",
+        "instantly",
+        "rushed",
+        "hurried",
+        "swift",
+    ),
+    "slow": (
+        "slowly",
+        "gradually",
+        "carefully",
+        "thoughtfully",
+        "deliberately",
+        "gently",
+        "quietly",
+    ),
+    "medium": ("steadily", "normally", "regularly", "evenly", "consistently"),
+})
+
+
 class PacingCalculator:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.tension_indicators = self._initialize_tension_indicators()
         self.pacing_indicators = self._initialize_pacing_indicators()
 
-    def _initialize_tension_indicators(self) -> Dict[str, Dict[str, List[str]]]:
+    def _initialize_tension_indicators(
+        self,
+    ) -> Mapping[str, Mapping[str, Tuple[str, ...]]]:
         """Initialize tension level indicators."""
-        return {
-            "high": {
-                "action": [
-                    "fight",
-                    "battle",
-                    "chase",
-                    "escape",
-                    "attack",
-                    "explosion",
-                    "crash",
-                    "run",
-                ],
-                "emotion": [
-                    "scream",
-                    "panic",
-                    "terror",
-                    "rage",
-                    "fury",
-                    "desperate",
-                    "frantic",
-                ],
-                "stakes": [
-                    "death",
-                    "kill",
-                    "destroy",
-                    "save",
-                    "rescue",
-                    "urgent",
-                    "critical",
-                    "final",
-                ],
-            },
-            "medium": {
-                "action": [
-                    "argue",
-                    "confront",
-                    "search",
-                    "investigate",
-                    "pursue",
-                    "challenge",
-                ],
-                "emotion": [
-                    "worry",
-                    "fear",
-                    "anger",
-                    "concern",
-                    "tension",
-                    "stress",
-                    "conflict",
-                ],
-                "stakes": [
-                    "important",
-                    "serious",
-                    "problem",
-                    "trouble",
-                    "danger",
-                    "risk",
-                ],
-            },
-            "low": {
-                "action": [
-                    "talk",
-                    "discuss",
-                    "walk",
-                    "sit",
-                    "think",
-                    "remember",
-                    "reflect",
-                ],
-                "emotion": [
-                    "calm",
-                    "peaceful",
-                    "quiet",
-                    "gentle",
-                    "soft",
-                    "relaxed",
-                    "content",
-                ],
-                "stakes": [
-                    "normal",
-                    "routine",
-                    "everyday",
-                    "simple",
-                    "easy",
-                    "comfortable",
-                ],
-            },
-        }
+        return _TENSION_INDICATORS
 
-    def _initialize_pacing_indicators(self) -> Dict[str, List[str]]:
+    def _initialize_pacing_indicators(self) -> Mapping[str, Tuple[str, ...]]:
         """Initialize pacing speed indicators."""
-        return {
-            "fast": [
-                "quickly",
-                "rapidly",
-                "suddenly",
-                "immediately",
-                "instantly",
-                "rushed",
-                "hurried",
-                "swift",
-            ],
-            "slow": [
-                "slowly",
-                "gradually",
-                "carefully",
-                "thoughtfully",
-                "deliberately",
-                "gently",
-                "quietly",
-            ],
-            "medium": ["steadily", "normally", "regularly", "evenly", "consistently"],
-        }
+        return _PACING_INDICATORS
 
     def calculate_pacing(self, narrative_beats: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -145,8 +152,13 @@ class PacingCalculator:
             # Analyze rhythm patterns
             rhythm_analysis = self._analyze_rhythm(narrative_beats, tension_curve)
 
+            # The story arc score feeds both the pacing score and genre compliance
+            arc_score = self._evaluate_story_arc(tension_curve)
+
             # Calculate overall pacing score
-            pacing_score = self._calculate_pacing_score(tension_curve, rhythm_analysis)
+            pacing_score = self._calculate_pacing_score(
+                tension_curve, rhythm_analysis, arc_score
+            )
 
             # Generate recommendations
             recommendations = self._generate_pacing_recommendations(
@@ -155,7 +167,7 @@ class PacingCalculator:
 
             # Assess genre compliance
             genre_compliance = self._assess_genre_compliance(
-                tension_curve, rhythm_analysis
+                tension_curve, rhythm_analysis, arc_score
             )
 
             # Calculate confidence score
@@ -262,9 +274,9 @@ class PacingCalculator:
             }
 
         # Identify sections by pacing
-        fast_sections = []
-        slow_sections = []
-        balanced_sections = []
+        fast_sections: List[Dict[str, Any]] = []
+        slow_sections: List[Dict[str, Any]] = []
+        balanced_sections: List[Dict[str, Any]] = []
 
         # Analyze pacing indicators in beat descriptions
         for i, beat in enumerate(narrative_beats):
@@ -280,32 +292,20 @@ class PacingCalculator:
 
             # Determine section type
             if fast_count > slow_count and fast_count > 0:
-                fast_sections.append(
-                    {
-                        "start": i,
-                        "end": i + 1,
-                        "tension_level": tension_curve[i],
-                        "description": beat.get("description", "")[:100] + "...",
-                    }
-                )
+                sections = fast_sections
             elif slow_count > fast_count and slow_count > 0:
-                slow_sections.append(
-                    {
-                        "start": i,
-                        "end": i + 1,
-                        "tension_level": tension_curve[i],
-                        "description": beat.get("description", "")[:100] + "...",
-                    }
-                )
+                sections = slow_sections
             else:
-                balanced_sections.append(
-                    {
-                        "start": i,
-                        "end": i + 1,
-                        "tension_level": tension_curve[i],
-                        "description": beat.get("description", "")[:100] + "...",
-                    }
-                )
+                sections = balanced_sections
+
+            sections.append(
+                {
+                    "start": i,
+                    "end": i + 1,
+                    "tension_level": tension_curve[i],
+                    "description": beat.get("description", "")[:100] + "...",
+                }
+            )
 
         # Calculate rhythm scores
         rhythm_score = self._calculate_rhythm_score(
@@ -375,7 +375,10 @@ class PacingCalculator:
         return max(0.1, min(1.0, variation_score))
 
     def _calculate_pacing_score(
-        self, tension_curve: List[float], rhythm_analysis: Dict
+        self,
+        tension_curve: List[float],
+        rhythm_analysis: Dict,
+        arc_score: float,
     ) -> float:
         """Calculate overall pacing quality score."""
         if not tension_curve:
@@ -385,9 +388,6 @@ class PacingCalculator:
         rhythm_score = rhythm_analysis.get("rhythm_score", 0.5)
         variation_score = rhythm_analysis.get("variation_score", 0.5)
 
-        # Check for proper story arc
-        arc_score = self._evaluate_story_arc(tension_curve)
-
         # Weighted combination
         pacing_score = rhythm_score * 0.4 + variation_score * 0.3 + arc_score * 0.3
 
@@ -433,14 +433,18 @@ class PacingCalculator:
         if not tension_curve:
             return ["Add more narrative beats to analyze pacing"]
 
-        tension_range = max(tension_curve) - min(tension_curve)
+        # Find the peak once; it serves both checks below
+        peak = max(tension_curve)
+        peak_index = tension_curve.index(peak)
+
+        tension_range = peak - min(tension_curve)
         if tension_range < 0.3:
             recommendations.append(
                 "Increase tension variation - add more dramatic peaks and valleys"
             )
 
         # Check for proper climax
-        max_tension_pos = tension_curve.index(max(tension_curve)) / len(tension_curve)
+        max_tension_pos = peak_index / len(tension_curve)
         if max_tension_pos < 0.6:
             recommendations.append("Move climax later in the story for better pacing")
         elif max_tension_pos > 0.9:
@@ -492,7 +496,10 @@ class PacingCalculator:
         return flat_sections
 
     def _assess_genre_compliance(
-        self, tension_curve: List[float], rhythm_analysis: Dict
+        self,
+        tension_curve: List[float],
+        rhythm_analysis: Dict,
+        arc_score: float,
     ) -> float:
         """Assess how well pacing fits typical genre expectations."""
         # This is a simplified assessment - in practice, you'd compare against genre templates
@@ -509,10 +516,8 @@ class PacingCalculator:
             base_compliance += 0.1
 
         # Proper story arc fits most genres
-        if tension_curve:
-            arc_score = self._evaluate_story_arc(tension_curve)
-            if arc_score > 0.6:
-                base_compliance += 0.1
+        if tension_curve and arc_score > 0.6:
+            base_compliance += 0.1
 
         return max(0.1, min(1.0, base_compliance))
 
@@ -132,6 +132,20 @@ def test_validate_world_consistency(consistency_validator: ConsistencyValidator)
     world_issues = [issue for issue in report["issues"] if issue["type"] == "world"]
     assert len(world_issues) > 0
 
+def test_validate_non_string_world_rules(consistency_validator: ConsistencyValidator):
+    """Test that non-string world rules do not break validation."""
+    report = consistency_validator.validate({
+        "world_details": [{"aspect": "physics", "consistency_rule": ["magic"]}],
+        "events": []
+    })
+    assert report["overall_score"] == 1.0
+
+    report = consistency_validator.validate({
+        "world_details": [{"aspect": "jurisdiction", "consistency_rule": {"city": "limits"}}],
+        "events": [{"description": "Police arrest the suspect"}]
+    })
+    assert not [issue for issue in report["issues"] if issue["type"] == "world"]
+
 def test_validate_plot_consistency(consistency_validator: ConsistencyValidator):
     """Test plot consistency validation."""
     story_elements = {
@@ -185,9 +199,22 @@ def test_cause_effect_analysis(consistency_validator: ConsistencyValidator):
         {"description": "John kills the villain"},
         {"description": "Everyone celebrates"}  # No death consequences
     ]
-    issues = consistency_validator._analyze_cause_effect(events)
+    descriptions = [event["description"].lower() for event in events]
+    issues = consistency_validator._analyze_cause_effect(events, descriptions)
     assert len(issues) > 0
 
+def test_cause_effect_consequence_found(consistency_validator: ConsistencyValidator):
+    """Test that consequences within the next events satisfy a trigger."""
+    events = [
+        {"description": "John kills the villain"},
+        {"description": "The town gathers for a funeral"},
+        {"description": "Police arrest the accomplice"},
+        {"description": "Everyone celebrates"}
+    ]
+    descriptions = [event["description"].lower() for event in events]
+    issues = consistency_validator._analyze_cause_effect(events, descriptions)
+    assert [issue["location"] for issue in issues] == ["Event 3"]
+
 def test_recommendation_generation(consistency_validator: ConsistencyValidator):
     """Test recommendation generation."""
     issues = [
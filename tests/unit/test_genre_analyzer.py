@@ -136,3 +136,12 @@ def test_confidence_calculation(genre_analyzer: GenreAnalyzer):
 
     confidence = genre_analyzer._calculate_genre_confidence(content_analysis, 8, 4)
     assert 0.1 <= confidence <= 0.95
+
+def test_genre_loaders_do_not_share_templates():
+    """Test that templates from one loader cannot leak into another."""
+    config_path = Path(__file__).resolve().parent.parent.parent / "config" / "genres"
+    first = GenreLoader(config_path=str(config_path))
+    first.genres["superhero"].conventions[0].examples.append("leaked example")
+
+    second = GenreLoader(config_path=str(config_path))
+    assert "leaked example" not in second.genres["superhero"].conventions[0].examples
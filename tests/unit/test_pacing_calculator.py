@@ -195,13 +195,17 @@ def test_genre_compliance_assessment(pacing_calculator: PacingCalculator):
     good_rhythm = {"rhythm_score": 0.8, "variation_score": 0.7}
     good_curve = [0.3, 0.6, 0.9, 0.4]
     
-    compliance = pacing_calculator._assess_genre_compliance(good_curve, good_rhythm)
+    compliance = pacing_calculator._assess_genre_compliance(
+        good_curve, good_rhythm, pacing_calculator._evaluate_story_arc(good_curve)
+    )
     assert compliance > 0.7
     
     poor_rhythm = {"rhythm_score": 0.3, "variation_score": 0.2}
     poor_curve = [0.5, 0.5, 0.5, 0.5]
     
-    compliance = pacing_calculator._assess_genre_compliance(poor_curve, poor_rhythm)
+    compliance = pacing_calculator._assess_genre_compliance(
+        poor_curve, poor_rhythm, pacing_calculator._evaluate_story_arc(poor_curve)
+    )
     assert compliance < 0.8
 
 def test_confidence_calculation(pacing_calculator: PacingCalculator):